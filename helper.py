@@ -20,9 +20,10 @@ def cut_using_string_manipulation(pruning_id, s, path = None):
   pruning_id +=1
   total_length = len(s)
   while(pruning_id < total_length):
-      if s[cut_num].name == '[':
+      name = s[cut_num].name
+      if name == '[':
           bracket_balance+=1
-      if s[cut_num].name == ']':
+      if name == ']':
           if bracket_balance == 0:
               break
           else:
@@ -42,23 +43,16 @@ def pruning_strategy(it, lstring):
   cut = False
   curr = 0
   while curr < len(lstring):
-    if lstring[curr] == '/':
-      if not (angle_between(lstring[curr].args[0], 0, 50) or angle_between(lstring[curr].args[0], 130, 180)):
-        if(len(lstring[curr].args) > 1):
-          if lstring[curr].args[1] == "no cut":
+    mod = lstring[curr]
+    if mod.name in ('/', '&'):
+      args = mod.args
+      if not (angle_between(args[0], 0, 50) or angle_between(args[0], 130, 180)):
+        if(len(args) > 1):
+          if args[1] == "no cut":
             curr+=1
             continue
         
-        print("Cutting", curr, lstring[curr], (lstring[curr].args[0]+180))
-        #lstring[curr].append("no cut")
-        lstring = cut_from(curr+1, lstring)
-    elif lstring[curr] == '&':
-      if not (angle_between(lstring[curr].args[0], 0, 50) or angle_between(lstring[curr].args[0], 130, 180)):
-        if(len(lstring[curr].args) > 1):
-          if lstring[curr].args[1] == "no cut":
-            curr+=1
-            continue
-        print("Cutting", curr, lstring[curr], (lstring[curr].args[0]+180))
+        print("Cutting", curr, mod, (args[0]+180))
         #lstring[curr].append("no cut")
         lstring = cut_from(curr+1, lstring)
     curr+=1
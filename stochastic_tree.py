@@ -10,6 +10,8 @@ from openalea.plantgl.scenegraph.cspline import CSpline
 import random as rd
 
 import collections
+import logging
+logger = logging.getLogger(__name__)
 eps = 1e-6
 
 from abc import ABC, abstractmethod
@@ -159,24 +161,26 @@ class BasicWood(ABC):
  
   def get_control_points(self, target, start, current, tie_axis):
     pts = []
-    Lcurve = np.sqrt((start[0]-current[0])**2 + (current[1]-start[1])**2 + (current[2]-start[2])**2)   
-    print(Lcurve, start, current)
-    if Lcurve**2 - (target[0]-start[0])**2*tie_axis[0] - (target[1]-start[1])**2*tie_axis[1] - (target[2]-start[2])**2*tie_axis[2]  < 0:
-      print("SHORT")
+    dx = np.array(current) - np.array(start)
+    Lcurve = np.linalg.norm(dx)
+    logger.debug('Curve length %s from %s to %s', Lcurve, start, current)
+    #Squared length left over once the tie axes are covered, compared before taking any sqrt
+    remaining = Lcurve**2 - np.dot((np.array(target) - np.array(start))**2, tie_axis)
+    if remaining < 0:
+      logger.debug('Branch too short to reach target %s', target)
       return pts,None
 
-    curve_end = np.sqrt(Lcurve**2 - (target[0]-start[0])*tie_axis[0]**2-(target[1]-start[1])*tie_axis[1]**2 - (target[2]-start[2])*tie_axis[2]**2)
+    curve_end = np.sqrt(remaining)
     i_target = [target[0], target[1], target[2]]
     for j,axis in enumerate(tie_axis):
       if axis == 0:
         i_target[j] = start[j]+target[j]/abs(target[j]+eps)*(curve_end)
         break
     dxyz = np.array(i_target) - np.array(current)
-    dx = np.array(current) - np.array(start)
-    for i in range(1,10*int(Lcurve)+1):
-      x = i/(10*int(Lcurve))
-      d = self.deflection_at_x(dxyz, x*Lcurve, Lcurve)
-      pts.append(tuple((start[0]+x*dx[0]+d[0],start[1]+x*dx[1]+d[1],start[2]+x*dx[2]+d[2])))
+    #Sample all 10*int(Lcurve) points at once, x is a column so deflection broadcasts to (n,3)
+    x = np.linspace(0, 1, 10*int(Lcurve)+1)[1:, None]
+    d = self.deflection_at_x(dxyz, x*Lcurve, Lcurve)
+    pts = [tuple(pt) for pt in np.array(start) + x*dx + d]
     return pts, i_target
       
 # class Branch(BasicWood):
@@ -216,6 +220,7 @@ class Support():
     self.spacing_wires = spacing_wires
     self.branch_axis = branch_axis
     self.branch_supports = self.make_support(points)#Dictionary id:points
+    self.branch_points = np.array(points, dtype=float).reshape(-1, 3)#Wire points in id order, built once since wires do not move
     self.trunk_axis = None
     self.trunk_wire = None
     if trunk_axis: